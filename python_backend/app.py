@@ -1,12 +1,40 @@
-from flask import Flask, request, jsonify
+import os
+
+# Silence TensorFlow's C++ logging; this must be set before tensorflow is first imported
+os.environ.setdefault('TF_CPP_MIN_LOG_LEVEL', '3')
+
+from flask import Flask
 from flask_cors import CORS
+from functools import wraps
 import json
-import os
+import threading
+import traceback
 import numpy as np
-from sign_to_speech_service import SignToSpeechService
-from gesture_recognizer import GestureRecognizer
-from advanced_gesture_recognizer import AdvancedGestureRecognizer
 from health_check import health_bp
+from serialization import json_response, get_request_json
+from cpu_utils import available_cpu_count, gunicorn_worker_count
+
+def configure_tensorflow():
+    """
+    Configure the TensorFlow runtime once, before any model is built or loaded
+    """
+    import tensorflow as tf
+
+    tf.get_logger().setLevel('ERROR')
+
+    # Split the CPUs between gunicorn workers so they don't oversubscribe the host
+    intra_op_threads = int(os.environ.get('TF_INTRA_OP_THREADS', max(1, available_cpu_count() // gunicorn_worker_count())))
+
+    try:
+        # Allocate GPU memory on demand instead of reserving all of it at first inference
+        for gpu in tf.config.list_physical_devices('GPU'):
+            tf.config.experimental.set_memory_growth(gpu, True)
+
+        tf.config.threading.set_intra_op_parallelism_threads(intra_op_threads)
+        tf.config.threading.set_inter_op_parallelism_threads(2)
+    except RuntimeError as e:
+        # The runtime was already initialized elsewhere; keep its settings
+        print(f"Could not configure TensorFlow runtime: {e}")
 
 app = Flask(__name__)
 CORS(app)
@@ -14,150 +42,212 @@ CORS(app)
 # Register blueprints
 app.register_blueprint(health_bp)
 
-# Initialize services
-sign_to_speech_service = SignToSpeechService()
-gesture_recognizer = GestureRecognizer()
-advanced_recognizer = AdvancedGestureRecognizer()
+# Services are built on a background thread so the worker can answer /status
+# while TensorFlow, MediaPipe and the models load
+services_ready = threading.Event()
+services_error = None
+sign_to_speech_service = None
+gesture_recognizer = None
+advanced_recognizer = None
+
+def initialize_services():
+    """
+    Import TensorFlow, build the recognition services and mark the backend ready
+    """
+    global sign_to_speech_service, gesture_recognizer, advanced_recognizer, services_error
+
+    try:
+        configure_tensorflow()
+
+        from sign_to_speech_service import SignToSpeechService
+        from gesture_recognizer import GestureRecognizer
+        from advanced_gesture_recognizer import AdvancedGestureRecognizer
+
+        sign_to_speech_service = SignToSpeechService()
+        gesture_recognizer = GestureRecognizer()
+        advanced_recognizer = AdvancedGestureRecognizer()
+    except Exception as e:
+        traceback.print_exc()
+        services_error = str(e)
+        return
+
+    services_ready.set()
+
+def requires_services(view):
+    """
+    Reject requests with 503 until the recognition services are ready
+    """
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        if not services_ready.is_set():
+            return json_response({
+                'error': services_error or 'Models are still loading'
+            }, 503)
+        return view(*args, **kwargs)
+    return wrapper
+
+threading.Thread(target=initialize_services, name='initialize-services', daemon=True).start()
 
 @app.route('/status', methods=['GET'])
 def status():
     """
-    Check if the server is running
+    Check if the server is running and ready to serve requests
     """
-    return jsonify({
+    if services_error:
+        return json_response({
+            'status': 'error',
+            'message': f'Python backend failed to start: {services_error}'
+        }, 503)
+
+    if not services_ready.is_set():
+        return json_response({
+            'status': 'loading',
+            'message': 'Python backend is loading models'
+        }, 503)
+
+    return json_response({
         'status': 'ok',
         'message': 'Python backend is running'
     })
 
 @app.route('/process-landmarks', methods=['POST'])
+@requires_services
 def process_landmarks():
     """
     Process hand landmarks for sign language recognition
     """
-    data = request.json
+    data = get_request_json()
     landmarks = data.get('landmarks')
     
     if not landmarks:
-        return jsonify({
+        return json_response({
             'error': 'No landmarks provided'
-        }), 400
+        }, 400)
     
     result = sign_to_speech_service.process_landmarks(landmarks)
-    return jsonify(result)
+    return json_response(result)
 
 @app.route('/process-frame', methods=['POST'])
+@requires_services
 def process_frame():
     """
     Process video frame for sign language recognition
     """
-    data = request.json
+    data = get_request_json()
     image_data = data.get('image')
     
     if not image_data:
-        return jsonify({
+        return json_response({
             'error': 'No image data provided'
-        }), 400
+        }, 400)
     
     result = sign_to_speech_service.process_frame(image_data)
-    return jsonify(result)
+    return json_response(result)
 
 @app.route('/train-model', methods=['POST'])
+@requires_services
 def train_model():
     """
     Train a model with the provided data
     """
-    data = request.json
+    data = get_request_json()
     
     if not data:
-        return jsonify({
+        return json_response({
             'error': 'No training data provided'
-        }), 400
+        }, 400)
     
     # Use advanced recognizer for training
     result = advanced_recognizer.train_model(data)
-    return jsonify(result)
+    return json_response(result)
 
 @app.route('/evaluate-model', methods=['POST'])
+@requires_services
 def evaluate_model():
     """
     Evaluate a model with the provided data
     """
-    data = request.json
+    data = get_request_json()
     
     if not data:
-        return jsonify({
+        return json_response({
             'error': 'No evaluation data provided'
-        }), 400
+        }, 400)
     
     # Use advanced recognizer for evaluation
     result = advanced_recognizer.evaluate_model(data)
-    return jsonify(result)
+    return json_response(result)
 
 @app.route('/predict', methods=['POST'])
+@requires_services
 def predict():
     """
     Make a prediction with the trained model
     """
-    data = request.json
+    data = get_request_json()
     
     if not data:
-        return jsonify({
+        return json_response({
             'error': 'No prediction data provided'
-        }), 400
+        }, 400)
     
     # Use advanced recognizer for prediction
     result = advanced_recognizer.predict(data)
-    return jsonify(result)
+    return json_response(result)
 
 @app.route('/save-model', methods=['POST'])
+@requires_services
 def save_model():
     """
     Save the trained model
     """
-    data = request.json
+    data = get_request_json()
     
     if not data:
-        return jsonify({
+        return json_response({
             'error': 'No model data provided'
-        }), 400
+        }, 400)
     
     model_name = data.get('model_name', 'default_model')
     
     # Use advanced recognizer to save the model
     result = advanced_recognizer.save_model(model_name)
-    return jsonify(result)
+    return json_response(result)
 
 @app.route('/load-model', methods=['POST'])
+@requires_services
 def load_model():
     """
     Load a trained model
     """
-    data = request.json
+    data = get_request_json()
     
     if not data:
-        return jsonify({
+        return json_response({
             'error': 'No model data provided'
-        }), 400
+        }, 400)
     
     model_name = data.get('model_name')
     
     if not model_name:
-        return jsonify({
+        return json_response({
             'error': 'No model name provided'
-        }), 400
+        }, 400)
     
     # Use advanced recognizer to load the model
     result = advanced_recognizer.load_model(model_name)
-    return jsonify(result)
+    return json_response(result)
 
 @app.route('/list-models', methods=['GET'])
+@requires_services
 def list_models():
     """
     List all available models
     """
     # Use advanced recognizer to list models
     result = advanced_recognizer.list_models()
-    return jsonify(result)
+    return json_response(result)
 
 if __name__ == '__main__':
-    app.run(host='0.0.0.0', port=5000, debug=True)
+    # Development server only; production runs under gunicorn (see gunicorn_conf.py)
+    app.run(host='0.0.0.0', port=5000, debug=os.environ.get('FLASK_DEBUG') == '1')
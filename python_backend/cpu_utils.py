@@ -0,0 +1,15 @@
+import os
+
+def available_cpu_count():
+    """
+    Number of CPUs this process may run on, honoring container CPU affinity
+    """
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+def gunicorn_worker_count():
+    """
+    Number of gunicorn worker processes, read from GUNICORN_WORKERS (at least 1)
+    """
+    return max(1, int(os.environ.get('GUNICORN_WORKERS', 1)))
@@ -0,0 +1,21 @@
+import os
+from cpu_utils import available_cpu_count, gunicorn_worker_count
+
+# Bind to the platform-provided port (Heroku/Railway/Render) or the default Flask port
+bind = '0.0.0.0:' + os.environ.get('PORT', '5000')
+
+# A single worker keeps one TensorFlow/MediaPipe process (and one CUDA context);
+# concurrency comes from threads sharing the loaded models
+workers = gunicorn_worker_count()
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', max(8, available_cpu_count() * 2)))
+
+# No preload_app: TensorFlow and CUDA are not fork-safe, so each worker imports
+# the app (and initializes TensorFlow) itself after it has been forked
+
+# With gthread workers this does not limit request duration: the worker keeps sending
+# heartbeats while long requests such as /train-model run on pool threads. It bounds
+# worker boot and heartbeats. Each worker loads TensorFlow, MediaPipe and the three
+# recognizers on a background thread (app.initialize_services), and those imports can
+# hold the GIL long enough to delay heartbeats past the 30s default
+timeout = 120
@@ -1,52 +1,91 @@
-from flask import Blueprint, jsonify
+from flask import Blueprint
+from functools import lru_cache
 import platform
 import psutil
-import tensorflow as tf
-import mediapipe as mp
 import os
+import threading
 import time
+from serialization import json_response
 
 health_bp = Blueprint('health', __name__)
 
-@health_bp.route('/health', methods=['GET'])
-def health_check():
+# Resource metrics are refreshed at most once per interval (seconds)
+METRICS_TTL = 1.0
+
+_metrics_lock = threading.Lock()
+_metrics = None
+_metrics_timestamp = 0.0
+
+@lru_cache(maxsize=1)
+def _get_static_status():
     """
-    Comprehensive health check endpoint for the Python backend
+    Collect information that does not change while the process is running
     """
-    start_time = time.time()
-    
-    # Basic system information
+    # Imported here so registering the blueprint doesn't load TensorFlow/MediaPipe
+    import tensorflow as tf
+    import mediapipe as mp
+
     system_info = {
         'python_version': platform.python_version(),
         'platform': platform.platform(),
         'cpu_count': os.cpu_count(),
-        'memory_available': psutil.virtual_memory().available / (1024 * 1024),  # MB
-        'disk_free': psutil.disk_usage('/').free / (1024 * 1024 * 1024),  # GB
     }
-    
+
     # Check TensorFlow
+    devices = tf.config.list_physical_devices()
     tf_status = {
         'version': tf.__version__,
-        'gpu_available': len(tf.config.list_physical_devices('GPU')) > 0,
-        'devices': [device.name for device in tf.config.list_physical_devices()]
+        'gpu_available': any(device.device_type == 'GPU' for device in devices),
+        'devices': [device.name for device in devices]
     }
-    
+
     # Check MediaPipe
     mp_status = {
         'version': mp.__version__,
         'holistic_available': hasattr(mp, 'solutions') and hasattr(mp.solutions, 'holistic')
     }
-    
-    # Check model directories
-    model_dirs = os.path.exists('./models')
-    
+
+    return system_info, tf_status, mp_status
+
+def _get_metrics():
+    """
+    Collect resource metrics, reusing the last sample within METRICS_TTL
+    """
+    global _metrics, _metrics_timestamp
+
+    with _metrics_lock:
+        now = time.monotonic()
+        if _metrics is None or now - _metrics_timestamp >= METRICS_TTL:
+            _metrics = {
+                'memory_available': psutil.virtual_memory().available / (1024 * 1024),  # MB
+                'disk_free': psutil.disk_usage('/').free / (1024 * 1024 * 1024),  # GB
+                'model_directories': os.path.exists('./models')
+            }
+            _metrics_timestamp = now
+
+        return _metrics
+
+@health_bp.route('/health', methods=['GET'])
+def health_check():
+    """
+    Comprehensive health check endpoint for the Python backend
+    """
+    start_time = time.time()
+
+    system_info, tf_status, mp_status = _get_static_status()
+    metrics = _get_metrics()
+
     response_time = time.time() - start_time
-    
-    return jsonify({
+
+    return json_response({
         'status': 'healthy',
         'response_time': response_time,
-        'system': system_info,
+        'system': {
+            **system_info,
+            'memory_available': metrics['memory_available'],
+            'disk_free': metrics['disk_free'],
+        },
         'tensorflow': tf_status,
         'mediapipe': mp_status,
-        'model_directories': model_dirs
+        'model_directories': metrics['model_directories']
     })
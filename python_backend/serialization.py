@@ -0,0 +1,39 @@
+from flask import Response, request
+from werkzeug.exceptions import BadRequest
+import numpy as np
+import orjson
+
+ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+def _default(obj):
+    """
+    Fallback for values orjson cannot encode natively, such as
+    non-contiguous arrays and unsupported NumPy scalar types
+    """
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+def json_response(payload, status=200):
+    """
+    Serialize a response body with orjson, encoding NumPy arrays directly
+    """
+    return Response(
+        orjson.dumps(payload, default=_default, option=ORJSON_OPTIONS),
+        status=status,
+        mimetype='application/json'
+    )
+
+def get_request_json():
+    """
+    Parse the JSON request body with orjson, mirroring Flask's request.json
+    """
+    if not request.is_json:
+        return None
+
+    try:
+        return orjson.loads(request.get_data(cache=True))
+    except orjson.JSONDecodeError:
+        raise BadRequest('Failed to decode JSON object')
@@ -119,7 +119,7 @@ export async function deployProject(
         console.log("1. Create a new Web Service on Render")
         console.log("2. Connect your GitHub repository")
         console.log("3. Set the build command to: pip install -r requirements.txt")
-        console.log("4. Set the start command to: gunicorn wsgi:app")
+        console.log("4. Set the start command to: gunicorn -c gunicorn_conf.py wsgi:app")
 
         if (!backendUrl) {
           finalBackendUrl = await prompt("Enter the URL provided by Render:")